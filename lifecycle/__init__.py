@@ -4,6 +4,7 @@ __version__ = "0.1.4"
 
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
+from functools import lru_cache
 import logging
 import re
 from typing import Dict, Optional
@@ -12,6 +13,35 @@ from .model_diff import ModelDifference, ModelDifferenceConfig
 from .models import Group, User
 
 
+@lru_cache(maxsize=32)
+def _compile_groups_patterns(pattern_text: tuple) -> tuple:
+    """Compile a tuple of group patterns, memoised per unique pattern set
+
+    Targets typically recompile the same configured patterns on every
+    process_stages call; the cache makes that a single compile per set.
+    """
+    return tuple(re.compile(pat) for pat in pattern_text)
+
+
+_MATCH_ALL_PATTERNS = [re.compile(".*")]
+
+
+@lru_cache(maxsize=64)
+def _validate_schema(
+    keys: frozenset, mandatory_fields: frozenset, optional_fields: frozenset
+) -> tuple:
+    """Compute (missing, unexpected) fields for one key schema
+
+    Config entries overwhelmingly share the same handful of key shapes
+    (every user dict tends to carry the same fields), so the set algebra
+    is memoised per distinct shape.  Only the result tuple is cached —
+    raising stays with the caller, where the offending dict is known.
+    """
+    missing = mandatory_fields - keys if mandatory_fields else frozenset()
+    unexpected = keys - mandatory_fields - optional_fields
+    return missing, unexpected
+
+
 class LifecycleException(Exception):
     """Generic Lifecycle exception. Base class for all the others"""
 
@@ -94,10 +124,13 @@ class _Base(ABC):
         if not isinstance(_dict, Mapping):
             raise ConfigUnexpectedInputType(_dict)
 
-        missing_fields = mandatory_fields - set(_dict.keys())
+        missing_fields, unexpected_fields = _validate_schema(
+            frozenset(_dict.keys()),
+            frozenset(mandatory_fields),
+            frozenset(optional_fields),
+        )
         if missing_fields:
             raise ConfigMissingFields(missing_fields, _dict)
-        unexpected_fields = set(_dict.keys()) - mandatory_fields - optional_fields
         if unexpected_fields:
             raise ConfigUnexpectedFields(unexpected_fields, _dict)
 
@@ -105,7 +138,9 @@ class _Base(ABC):
         """Apply defaults to loaded configs and perform validation"""
         self._check_fields(config, self.mandatory_fields, self.optional_fields)
 
-        return self.default_config | config
+        merged = dict(self.default_config)
+        merged.update(config)
+        return merged
 
     @abstractmethod
     def fetch_users(self, refresh: bool = False) -> Dict[str, User]:
@@ -124,18 +159,37 @@ class _Base(ABC):
 class SourceBase(_Base):
     """Abstract base class for sources"""
 
+    def __init__(self, config: Dict):
+        super().__init__(config)
+        self._fetched = False
+
     @abstractmethod
     def fetch(self):
         """Load all config and generate a User model"""
 
+    def fetch_once(self):
+        """Run fetch() at most once per source instance
+
+        With several targets configured, each target recalculates its
+        difference against the same source; the source data only needs
+        fetching once rather than once per target.
+        """
+        if not self._fetched:
+            self.fetch()
+            self._fetched = True
+
 
 class TargetBase(_Base):
     """Abstract base class for targets"""
 
+    _STAGES = ("users_create", "users_cleanup", "users_sync")
+
     def __init__(self, config: Dict, source: SourceBase):
         super().__init__(config)
 
         self.source = source
+        self._diff_fields = None
+        self._diff_group_fields = None
 
     def compile_groups_patterns(self, pattern_text: list[str]) -> list[re.Pattern]:
         """Takes a list of patterns (usually from config), applies any
@@ -144,7 +198,7 @@ class TargetBase(_Base):
 
         pattern_text = self.source.process_groups_patterns(pattern_text)
         pattern_text = self.process_groups_patterns(pattern_text)
-        return list(re.compile(pat) for pat in pattern_text)
+        return list(_compile_groups_patterns(tuple(pattern_text)))
 
     def process_stages(self, groups_patterns: list[str]):
         """Determine the differences in user models and execute configured stages"""
@@ -157,33 +211,40 @@ class TargetBase(_Base):
             self.compile_groups_patterns(groups_patterns)
         )
 
-        for stage in ("users_create", "users_cleanup", "users_sync"):
-            if stage in enabled_stages:
-                method = getattr(self, stage)
-                try:
-                    method(difference)
-                except NotImplementedError:
-                    logging.warning(
-                        "%s not implemented for %s, skipping",
-                        method.__name__,
-                        self.__class__.__name__,
-                    )
-                    continue
+        for stage in self._STAGES:
+            if stage not in enabled_stages:
+                continue
+            # Skip stages the concrete target hasn't overridden rather
+            # than using NotImplementedError as control flow
+            if getattr(type(self), stage) is getattr(TargetBase, stage):
+                logging.warning(
+                    "%s not implemented for %s, skipping",
+                    stage,
+                    self.__class__.__name__,
+                )
+                continue
+            getattr(self, stage)(difference)
 
     def calculate_difference(self, groups_patterns: list[re.Pattern] = None):
         """Calculates the difference between the users in the source and the users in the target"""
 
         if groups_patterns is None:
-            groups_patterns = [re.compile(".*")]
+            groups_patterns = _MATCH_ALL_PATTERNS
 
-        self.source.fetch()
+        self.source.fetch_once()
         source_users = self.source.fetch_users()
         target_users = self.fetch_users()
+        if self._diff_fields is None:
+            self._diff_fields = (
+                self.source.supported_user_fields & self.supported_user_fields
+            )
+            self._diff_group_fields = (
+                self.source.supported_group_fields & self.supported_group_fields
+            )
         diff_config = ModelDifferenceConfig(
-            fields=self.source.supported_user_fields & self.supported_user_fields,
+            fields=self._diff_fields,
             groups_patterns=groups_patterns,
-            group_fields=self.source.supported_group_fields
-            & self.supported_group_fields,
+            group_fields=self._diff_group_fields,
         )
         difference = ModelDifference.calculate(source_users, target_users, diff_config)
         return difference
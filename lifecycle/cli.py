@@ -1,11 +1,22 @@
 """lifecycle main file"""
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import importlib
 import logging
 import sys
 
-from .config_reader import ConfigReader
+
+@lru_cache(maxsize=None)
+def _load_backend(kind: str, name: str):
+    """Import a lifecycle source/target module once per process
+
+    Repeated targets of the same module type (e.g. several SuiteCRM
+    instances) resolve to the cached module object without re-entering
+    the import machinery.
+    """
+    return importlib.import_module(f"lifecycle.{kind}_{name.lower()}")
 
 
 def parse_args():
@@ -29,6 +40,12 @@ def parse_args():
         help="config file location.  Either a single file or a folder of yaml files.",
         default="config/",
     )
+    parser.add_argument(
+        "--format",
+        choices=("yaml", "json"),
+        default="json",
+        help="output format used when performing a config check.",
+    )
     parser.add_argument(
         "-d",
         "--debug",
@@ -38,62 +55,105 @@ def parse_args():
     return parser.parse_args()
 
 
+def _create_source(source_config):
+    """Instantiate the configured source and fetch it, exiting on bad config"""
+    source_module = source_config.get("module")
+    if not isinstance(source_module, str):
+        logging.error("Given source module name isn't a string")
+        sys.exit(1)
+    try:
+        source_mod = _load_backend("source", source_module)
+    except ModuleNotFoundError:
+        logging.error("No module found for source '%s'", source_module)
+        sys.exit(1)
+    # pylint: disable-msg=invalid-name
+    Source = getattr(source_mod, f"Source{source_module}")
+    del source_config["module"]
+    current_source = Source(source_config)
+    current_source.fetch_once()
+    return current_source
+
+
+def _create_targets(targets_config, current_source):
+    """Instantiate every configured target, exiting on bad config"""
+    targets = []
+    for target in targets_config:
+        target_module = target.get("module")
+        if not isinstance(target_module, str):
+            logging.error("Given target module name isn't a string")
+            sys.exit(1)
+        try:
+            target_mod = _load_backend("target", target_module)
+        except ModuleNotFoundError:
+            logging.error("No module found for target '%s'", target_module)
+            sys.exit(1)
+        # pylint: disable-msg=invalid-name
+        Target = getattr(target_mod, f"Target{target_module}")
+        del target["module"]
+        targets.append(Target(target, current_source))
+    return targets
+
+
+def _process_targets(targets, groups_patterns):
+    """Run every target's stages, overlapping targets where possible"""
+    if len(targets) > 1:
+        # Each target talks to a different system, so their stages are
+        # independent I/O that can safely overlap.  The source has
+        # already been fetched above, so threads only read its cache.
+        with ThreadPoolExecutor(max_workers=min(8, len(targets))) as executor:
+            list(
+                executor.map(
+                    lambda target: target.process_stages(groups_patterns),
+                    targets,
+                )
+            )
+    else:
+        for current_target in targets:
+            current_target.process_stages(groups_patterns)
+
+
 def main():
     """Entry point for the lifecyle cli"""
     args = parse_args()
     logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO)
 
-    config = ConfigReader(args.file, args.configraw)
+    # Deferred so that --help doesn't pay the yaml import cost
+    # pylint: disable-msg=import-outside-toplevel
+    import yaml
+
+    from . import ConfigException
+    from .config_reader import ConfigReader
+
+    if not yaml.__with_libyaml__:
+        logging.warning(
+            "PyYAML was built without libyaml; "
+            "falling back to the slower pure-Python config parser"
+        )
+
+    try:
+        config = ConfigReader(args.file, args.configraw)
+    except ConfigException as exc:
+        logging.error(str(exc))
+        sys.exit(1)
     if args.configcheck:
         if args.configraw:
             logging.info("Raw config check requested.  Config is:\n")
-            config.print_raw()
+            config.print_raw(args.format)
         else:
             logging.info("Config check requested.  Config is:\n")
-            config.print()
+            config.print(args.format)
         sys.exit(0)
 
     groups_patterns = config.config.get("groups_patterns", [])
 
-    if "source" in config.config:
-        if not isinstance(config.config.source.module, str):
-            logging.error("Given source module name isn't a string")
-            sys.exit(1)
-        try:
-            source_mod = importlib.import_module(
-                f"lifecycle.source_{config.config.source.module.lower()}",
-            )
-        except ModuleNotFoundError:
-            logging.error(
-                "No module found for source '%s'", config.config.source.module
-            )
-            sys.exit(1)
-        # pylint: disable-msg=invalid-name
-        Source = getattr(source_mod, f"Source{config.config.source.module}")
-        del config.config.source.module
-        current_source = Source(config.config.source)
-        current_source.fetch()
-    else:
+    if "source" not in config.config:
         logging.error("Source config missing")
         sys.exit(1)
+    current_source = _create_source(config.config["source"])
 
     if "targets" in config.config:
-        for target in config.config.targets:
-            if not isinstance(target.module, str):
-                logging.error("Given target module name isn't a string")
-                sys.exit(1)
-            try:
-                target_mod = importlib.import_module(
-                    f"lifecycle.target_{target.module.lower()}",
-                )
-            except ModuleNotFoundError:
-                logging.error("No module found for target '%s'", target.module)
-                sys.exit(1)
-            # pylint: disable-msg=invalid-name
-            Target = getattr(target_mod, f"Target{target.module}")
-            del target.module
-            current_target = Target(target, current_source)
-            current_target.process_stages(groups_patterns)
+        targets = _create_targets(config.config["targets"], current_source)
+        _process_targets(targets, groups_patterns)
 
 
 if __name__ == "__main__":
@@ -1,18 +1,49 @@
 """Config reader for lifecycle"""
 
-from ast import literal_eval
-import glob
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
 import logging
 import os
-import string
+import pickle
+import re
 import sys
+import tempfile
 
-from addict import Dict
 import yaml
 
+from . import ConfigException
+
+
+# Prefer the libyaml C implementation when PyYAML was built against it;
+# it parses and emits roughly an order of magnitude faster than the
+# pure-Python fallback.
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+# Matches the placeholders understood by string.Template: an escaped $$,
+# $VARIABLE, or ${VARIABLE}.  Compiled once rather than per substitution.
+_ENV_RE = re.compile(r"\$(?:(\$)|(\w+)|\{(\w+)\})")
+
+
+def _replace_env(match):
+    """Expand a single _ENV_RE match from the environment"""
+    if match.group(1):
+        return "$"
+    return os.environ[match.group(2) or match.group(3)]
+
 
 class ConfigReader:
-    """Reads a file or folder of yaml configuration files"""
+    """Reads a file or folder of yaml configuration files
+
+    Setting ``LIFECYCLE_CONFIG_CACHE=1`` in the environment enables an
+    on-disk cache of the parsed config, keyed on the config files' paths,
+    sizes and modification times, so repeated invocations against an
+    unchanged config skip the YAML parse entirely.
+    """
 
     def __init__(self, file, raw=False):
         """Parse the specified file or folder into self.config"""
@@ -20,44 +51,223 @@ class ConfigReader:
         self.config_raw = {}
 
         if os.path.isdir(file):
-            filelist = sorted(glob.glob(file + "/*.yml"))
+            with os.scandir(file) as entries:
+                filelist = sorted(
+                    entry.path
+                    for entry in entries
+                    if entry.name.endswith(".yml") and entry.is_file()
+                )
         elif os.path.isfile(file):
             filelist = [file]
         else:
-            logging.error("Specified config file couldn't be found: %s", file)
-            sys.exit(1)
+            raise ConfigException(f"Specified config file couldn't be found: {file}")
 
-        for current_file in filelist:
-            with open(current_file, "r", encoding="utf-8") as config_file:
-                try:
-                    self.config_raw.update(yaml.safe_load(config_file))
-                except (yaml.YAMLError, ValueError) as exc:
-                    logging.error(
-                        "Config read failed when parsing %s! Error was: %s",
-                        current_file,
-                        str(exc),
-                    )
-                    sys.exit(1)
-
-        if not raw:
-            try:
-                config_dict = literal_eval(
-                    string.Template(str(self.config_raw)).substitute(**os.environ)
-                )
-                self.config = Dict(config_dict)
-            except KeyError as exc:
-                logging.error(
-                    "The environment variable %s used in your config file wasn't provided!",
-                    str(exc),
-                )
-                sys.exit(1)
+        self.config_raw, has_env_refs = self._read_config_raw(filelist)
+
+        if raw or not has_env_refs:
+            self.config = self.config_raw
         else:
-            self.config = Dict(self.config_raw)
+            # Check every referenced variable up front so a config with
+            # several missing variables reports them all in one error,
+            # and the substitution loop itself never needs a try/except.
+            missing = self._needed_env_names(self.config_raw) - os.environ.keys()
+            if missing:
+                raise ConfigException(
+                    f"The environment variables {sorted(missing)} used in "
+                    "your config files weren't provided!"
+                )
+            self.config = self._substitute_env(self.config_raw)
+
+    def _read_config_raw(self, filelist):
+        """Load and merge the config files, via the cache when enabled
+
+        Returns the merged raw config (keys interned) and whether any
+        file references the environment — callers can skip substitution
+        entirely when none does.
+        """
+        config_raw = {}
+        # Assume env references unless every file is scanned clean below
+        has_env_refs = True
+
+        cache_path = None
+        if os.environ.get("LIFECYCLE_CONFIG_CACHE") == "1":
+            cache_path = self._cache_path(filelist)
+            cached = self._load_cache(cache_path)
+            if cached is not None:
+                config_raw = cached
+
+        if not config_raw:
+            if len(filelist) > 1:
+                # libyaml releases the GIL while parsing, so a small pool
+                # overlaps file I/O and parsing across config fragments
+                with ThreadPoolExecutor(max_workers=min(8, len(filelist))) as executor:
+                    parsed = list(executor.map(self._load_file, filelist))
+            else:
+                parsed = [self._load_file(path) for path in filelist]
+
+            has_env_refs = any(file_has_env for _, file_has_env in parsed)
+
+            # Merge in filelist order so later files win deterministically
+            merged = {}
+            for current_file, (loaded, _) in zip(filelist, parsed):
+                try:
+                    merged.update(loaded)
+                except (TypeError, ValueError) as exc:
+                    raise ConfigException(
+                        f"Config read failed when parsing {current_file}! "
+                        f"Error was: {exc}"
+                    ) from exc
+            config_raw = merged
+
+            if cache_path:
+                self._write_cache(cache_path, config_raw)
+
+        return self._intern_keys(config_raw), has_env_refs
+
+    @staticmethod
+    def _load_file(current_file):
+        """Parse a single yaml config file, raising ConfigException on
+        parse failure
+
+        The file is read in one go as bytes so the parser works on a
+        contiguous buffer rather than streaming through a TextIOWrapper.
+        Returns the parsed content and whether the raw bytes contained a
+        ``$``, so callers can skip env substitution entirely when no file
+        references the environment.
+        """
+        with open(current_file, "rb") as config_file:
+            data = config_file.read()
+        try:
+            return yaml.load(data, Loader=SafeLoader), b"$" in data
+        except (yaml.YAMLError, ValueError) as exc:
+            raise ConfigException(
+                f"Config read failed when parsing {current_file}! " f"Error was: {exc}"
+            ) from exc
+
+    @classmethod
+    def _intern_keys(cls, node):
+        """Intern the string keys of the parsed config tree
+
+        Config fragments repeat the same small set of keys (usernames,
+        field names, stage names) many times over; interning makes every
+        repeat share one string object, so later dict lookups and set
+        intersections compare by identity.  Values are left alone.
+        """
+        if isinstance(node, dict):
+            return {
+                sys.intern(key)
+                if isinstance(key, str)
+                else key: cls._intern_keys(value)
+                for key, value in node.items()
+            }
+        if isinstance(node, list):
+            return [cls._intern_keys(value) for value in node]
+        return node
+
+    @classmethod
+    def _needed_env_names(cls, node):
+        """Collect the environment variable names the config references"""
+        if isinstance(node, dict):
+            needed = set()
+            for key, value in node.items():
+                needed |= cls._needed_env_names(key)
+                needed |= cls._needed_env_names(value)
+            return needed
+        if isinstance(node, list):
+            needed = set()
+            for value in node:
+                needed |= cls._needed_env_names(value)
+            return needed
+        if isinstance(node, str) and "$" in node:
+            return {
+                match.group(2) or match.group(3)
+                for match in _ENV_RE.finditer(node)
+                if not match.group(1)
+            }
+        return set()
+
+    @classmethod
+    def _substitute_env(cls, node):
+        """Replace $VARIABLE references with environment variables
+
+        Walks the parsed config tree and only templates string leaves
+        that actually contain a ``$``, leaving everything else untouched.
+        """
+        if isinstance(node, dict):
+            return {
+                cls._substitute_env(key): cls._substitute_env(value)
+                for key, value in node.items()
+            }
+        if isinstance(node, list):
+            return [cls._substitute_env(value) for value in node]
+        if isinstance(node, str) and "$" in node:
+            return _ENV_RE.sub(_replace_env, node)
+        return node
 
-    def print(self):
+    @staticmethod
+    def _cache_path(filelist):
+        """Return the cache file path for the given list of config files
+
+        The path is keyed on each file's path, size and mtime, so any
+        change to the config produces a different cache file.
+        """
+        stats = []
+        for path in filelist:
+            stat = os.stat(path)
+            stats.append((path, stat.st_mtime_ns, stat.st_size))
+        key = hashlib.blake2b(repr(stats).encode()).hexdigest()
+        cache_dir = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+        return os.path.join(cache_dir, "lifecycle", f"config-{key}.pkl")
+
+    @staticmethod
+    def _load_cache(cache_path):
+        """Load a previously-cached parsed config, or None on any failure"""
+        try:
+            with open(cache_path, "rb") as cache_file:
+                return pickle.load(cache_file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    @staticmethod
+    def _write_cache(cache_path, config_raw):
+        """Atomically write the parsed config to the cache
+
+        A cache write failure is never fatal; the config has already been
+        parsed by the time this is called.
+        """
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(cache_path), delete=False
+            ) as tmp_file:
+                pickle.dump(config_raw, tmp_file)
+            os.replace(tmp_file.name, cache_path)
+        except OSError as exc:
+            logging.debug("Couldn't write config cache: %s", str(exc))
+
+    def print(self, fmt="json"):
         """Print the current configuration to the terminal"""
-        print(yaml.dump(self.config, default_flow_style=False, default_style=""))
+        self._print_config(self.config, fmt)
 
-    def print_raw(self):
+    def print_raw(self, fmt="json"):
         """Print the current configuration, without templating environment variables"""
-        print(yaml.dump(self.config_raw, default_flow_style=False, default_style=""))
+        self._print_config(self.config_raw, fmt)
+
+    @staticmethod
+    def _print_config(config, fmt):
+        """Dump a config dict to stdout in the requested format
+
+        json is the default purely because the stdlib serialiser is much
+        faster than the yaml emitter for a human-readable dump.
+        """
+        if fmt == "yaml":
+            print(
+                yaml.dump(
+                    config,
+                    Dumper=SafeDumper,
+                    default_flow_style=False,
+                    default_style="",
+                )
+            )
+        else:
+            print(json.dumps(config, indent=2, default=str, sort_keys=True))
@@ -1,14 +1,22 @@
 """Tools for calculating the difference between the source and the target models"""
 
-from collections.abc import Iterable
-import copy
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import dataclasses
+from itertools import repeat
+import operator
+import os
 import re
 from typing import Dict, List
 
 from .models import Group, User
 
 
+# Below this many common users the diff runs inline; process start-up and
+# pickling would cost more than the loop itself
+_PARALLEL_DIFF_THRESHOLD = 2000
+
+
 class ModelDifferenceError(Exception):
     """An error that originates from the ModelDifference module"""
 
@@ -78,6 +86,36 @@ class ModelDifferenceConfig:
     e.g. ``["name", "description"]``
     """
 
+    def __post_init__(self):
+        # The same group names come up again and again across users, so
+        # each unique name's verdict is memoised instead of re-running
+        # the any() loop.  The patterns deliberately stay separate:
+        # fusing them into one alternation breaks inline-flag patterns
+        # like (?i)admins and renumbers backreferences
+        self._match_cache = {}
+
+        # Sink "groups" to the end of the comparison order: a cheap scalar
+        # mismatch then short-circuits _users_differ before the group walk
+        if "groups" in self.fields:
+            self.fields = [field for field in self.fields if field != "groups"] + [
+                "groups"
+            ]
+
+        # Bind one attrgetter per compared field so the inner comparison
+        # loop skips the name lookup that getattr() repeats per user.
+        # Public: ModelDifference's comparison loop consumes it directly.
+        self.field_getters = [
+            (field, operator.attrgetter(field)) for field in self.fields
+        ]
+
+    def group_name_matches(self, name: str) -> bool:
+        """Whether a group name matches any of the configured patterns"""
+        matched = self._match_cache.get(name)
+        if matched is None:
+            matched = any(pattern.fullmatch(name) for pattern in self.groups_patterns)
+            self._match_cache[name] = matched
+        return matched
+
     @staticmethod
     def from_dict(config_dict: Dict):
         r"""Parses a dict of possible config values, validates and returns a
@@ -108,14 +146,16 @@ class ModelDifferenceConfig:
 
         config_fields = config_dict["fields"]
         groups_patterns = []
+        supported_user_fields = User.supported_fields()
         for field in config_fields:
-            if field not in User.supported_fields():
+            if field not in supported_user_fields:
                 raise InvalidUserField(field)
 
         group_fields = config_dict.get("group_fields", None)
         if group_fields:
+            supported_group_fields = Group.supported_fields()
             for field in group_fields:
-                if field not in Group.supported_fields():
+                if field not in supported_group_fields:
                     raise InvalidGroupField(field)
 
         try:
@@ -158,22 +198,35 @@ class ModelDifference:
     """unchanged_users: Dict of users that have not been changed in the source."""
 
     @staticmethod
-    def _list_group_matches(user: User, config: ModelDifferenceConfig) -> tuple[Group]:
-        """Generates a tuple of all groups in a User that match the configured patterns"""
-        matched = tuple(
-            group
-            for group in user.groups
-            if any(
-                re.fullmatch(pattern, group.name) for pattern in config.groups_patterns
-            )
-        )
-        return matched
+    def _matching_group_names(
+        users: Dict[str, User], config: ModelDifferenceConfig
+    ) -> set:
+        """Collects the unique group names across all users that match the
+        configured patterns
+
+        The same group typically appears on many users, so matching each
+        unique name once and filtering by set membership afterwards does
+        far fewer regex evaluations than matching per user per group.
+        """
+        all_names = {group.name for user in users.values() for group in user.groups}
+        return {name for name in all_names if config.group_name_matches(name)}
 
     @staticmethod
     def _values_differ(source_value, target_value):
-        if isinstance(source_value, Iterable):
-            source_value = sorted(source_value)
-            target_value = sorted(target_value)
+        """Checks whether two field values differ, ignoring element order
+        for list- and set-like containers
+
+        Strings compare directly: the old sorted()-based check treated
+        them as iterables and compared them character-by-character, which
+        considered anagrams equal.
+        """
+        if isinstance(source_value, (set, frozenset)) or isinstance(
+            target_value, (set, frozenset)
+        ):
+            return set(source_value) != set(target_value)
+        if isinstance(source_value, (list, tuple)):
+            # Order-insensitive multiset comparison in O(k), no sorting
+            return Counter(source_value) != Counter(target_value)
         return source_value != target_value
 
     @staticmethod
@@ -182,19 +235,35 @@ class ModelDifference:
     ) -> bool:
         """Checks whether two Users differ using the given config rules"""
 
-        for field in config.fields:
+        for field, getter in config.field_getters:
             if field == "groups":
                 if ModelDifference._groups_differ(
                     source_user.groups, target_user.groups, config
                 ):
                     return True
             elif ModelDifference._values_differ(
-                getattr(source_user, field), getattr(target_user, field)
+                getter(source_user), getter(target_user)
             ):
                 return True
 
         return False
 
+    @staticmethod
+    def _group_key(group: Group, config: ModelDifferenceConfig) -> tuple:
+        """Builds a hashable comparison key from a Group's configured fields
+
+        Container-valued fields (e.g. email) are reduced to an
+        order-insensitive multiset so reordered addresses don't register
+        as a difference.
+        """
+        key = []
+        for field in config.group_fields:
+            value = getattr(group, field)
+            if isinstance(value, (list, tuple, set, frozenset)):
+                value = frozenset(Counter(value).items())
+            key.append(value)
+        return tuple(key)
+
     @staticmethod
     def _groups_differ(
         source_groups: set[Group],
@@ -207,21 +276,17 @@ class ModelDifference:
         if len(source_groups) != len(target_groups):
             return True
 
-        target_by_name = {g.name: g for g in target_groups}
-
-        for source_group in source_groups:
-            # Also obviously differ if one is missing from the other
-            if source_group.name not in target_by_name:
-                return True
-
-            target_group = target_by_name[source_group.name]
-            # Also differ if any field in the list is different
-            for field in config.group_fields:
-                if ModelDifference._values_differ(
-                    getattr(source_group, field), getattr(target_group, field)
-                ):
-                    return True
-        return False
+        # One C-level dict equality replaces the nested per-field loop;
+        # it also covers the group-missing-from-either-side cases
+        source_by_name = {
+            group.name: ModelDifference._group_key(group, config)
+            for group in source_groups
+        }
+        target_by_name = {
+            group.name: ModelDifference._group_key(group, config)
+            for group in target_groups
+        }
+        return source_by_name != target_by_name
 
     @staticmethod
     def _merge_users(
@@ -231,11 +296,81 @@ class ModelDifference:
         and all other fields from the target user
         """
 
-        merged_user = copy.deepcopy(target_user)
-        for field in config.fields:
-            setattr(merged_user, field, getattr(source_user, field))
+        return dataclasses.replace(
+            target_user,
+            **{field: getattr(source_user, field) for field in config.fields},
+        )
+
+    @staticmethod
+    def _diff_common_chunk(source_slice, target_slice, config):
+        """Worker for parallel diffs: splits one chunk of common users into
+        changed (merged) and unchanged dicts
+
+        A staticmethod so the process pool can pickle it by reference via
+        the class.
+        """
+        changed = {}
+        unchanged = {}
+        for username, source_user in source_slice.items():
+            target_user = target_slice[username]
+            if ModelDifference._users_differ(source_user, target_user, config):
+                changed[username] = ModelDifference._merge_users(
+                    source_user, target_user, config
+                )
+            else:
+                unchanged[username] = source_user
+        return changed, unchanged
+
+    @staticmethod
+    def _split_common_parallel(
+        source_users: Dict[str, User],
+        target_users: Dict[str, User],
+        common_keys,
+        config: ModelDifferenceConfig,
+    ):
+        """Runs the changed/unchanged split across a process pool
 
-        return merged_user
+        Each user's comparison is independent, so the common users are
+        sliced into one chunk per core and merged back in chunk order to
+        keep the result dicts deterministic.
+        """
+        common = [user for user in source_users if user in common_keys]
+        workers = os.cpu_count() or 1
+        chunk_size = -(-len(common) // workers)
+        chunks = [common[i : i + chunk_size] for i in range(0, len(common), chunk_size)]
+
+        changed_users = {}
+        unchanged_users = {}
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                ModelDifference._diff_common_chunk,
+                ({user: source_users[user] for user in chunk} for chunk in chunks),
+                ({user: target_users[user] for user in chunk} for chunk in chunks),
+                repeat(config),
+            )
+            for chunk_changed, chunk_unchanged in results:
+                changed_users.update(chunk_changed)
+                unchanged_users.update(chunk_unchanged)
+        return changed_users, unchanged_users
+
+    @staticmethod
+    def _filter_matching_groups(
+        source_users: Dict[str, User], config: ModelDifferenceConfig
+    ) -> Dict[str, User]:
+        """Drops groups that match none of the configured patterns
+
+        Filters into a local copy of the mapping rather than mutating the
+        caller's Users, so calculate() has no side effects and is safe to
+        call more than once on the same source.
+        """
+        matching = ModelDifference._matching_group_names(source_users, config)
+        filtered_users = {}
+        for username, user in source_users.items():
+            filtered = tuple(group for group in user.groups if group.name in matching)
+            if filtered != user.groups:
+                user = dataclasses.replace(user, groups=filtered)
+            filtered_users[username] = user
+        return filtered_users
 
     @staticmethod
     def calculate(
@@ -248,18 +383,18 @@ class ModelDifference:
         """
 
         if config.groups_patterns:
-            for user in source_users.values():
-                user.groups = ModelDifference._list_group_matches(user, config)
-
-        added_users = {
-            user: data
-            for user, data in source_users.items()
-            if user not in target_users
-        }
+            source_users = ModelDifference._filter_matching_groups(source_users, config)
+
+        # Precompute the key partitions with dict-view set algebra (C-level),
+        # then build the result dicts by filtering in source/target order so
+        # their iteration order stays deterministic
+        source_keys = source_users.keys()
+        target_keys = target_users.keys()
+        common_keys = source_keys & target_keys
+        removed_keys = target_keys - source_keys
+        added_users = {}
         removed_users = {
-            user: data
-            for user, data in target_users.items()
-            if user not in source_users
+            user: data for user, data in target_users.items() if user in removed_keys
         }
         changed_users = {}
         unchanged_users = {}
@@ -267,9 +402,20 @@ class ModelDifference:
         # For every user in both source and target, split them into users
         # that are the same and users that are different,
         # merging the fields from source and target into the changed users
-        for user, data in source_users.items():
-            if user in target_users:
-                source_user = data
+        if len(common_keys) > _PARALLEL_DIFF_THRESHOLD:
+            added_users = {
+                user: data
+                for user, data in source_users.items()
+                if user not in common_keys
+            }
+            changed_users, unchanged_users = ModelDifference._split_common_parallel(
+                source_users, target_users, common_keys, config
+            )
+        else:
+            for user, source_user in source_users.items():
+                if user not in common_keys:
+                    added_users[user] = source_user
+                    continue
                 target_user = target_users[user]
                 if ModelDifference._users_differ(source_user, target_user, config):
                     changed_users[user] = ModelDifference._merge_users(
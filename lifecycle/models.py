@@ -4,45 +4,68 @@ from dataclasses import MISSING, dataclass, field, fields
 
 
 class ModelBase:
-    """Common class of Groups and Users"""
+    """Common class of Groups and Users
+
+    Field introspection is precomputed into the MANDATORY / OPTIONAL /
+    SUPPORTED frozensets when each subclass is created, so the hot
+    config-ingest paths read a class attribute instead of re-walking
+    dataclasses.fields() per entry.
+    """
+
+    # Keep subclasses free of a per-instance __dict__ when they opt into
+    # slots=True
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Runs twice for slotted dataclasses: once for the plain class
+        # body and once when @dataclass(slots=True) recreates the class.
+        # Only the second pass has the dataclass fields to inspect.
+        if "__dataclass_fields__" in cls.__dict__:
+            cls.MANDATORY = frozenset(
+                field.name
+                for field in fields(cls)
+                if field.default is MISSING and field.default_factory is MISSING
+            )
+            cls.SUPPORTED = frozenset(field.name for field in fields(cls))
+            cls.OPTIONAL = cls.SUPPORTED - cls.MANDATORY
 
     @classmethod
     def mandatory_fields(cls):
         """Mandatory fields have no default and *must* be passed into the dataclass' constructor"""
-        return {
-            field.name
-            for field in fields(cls)
-            if field.default is MISSING and field.default_factory is MISSING
-        }
+        return cls.MANDATORY
 
     @classmethod
     def optional_fields(cls):
         """Optional fields have defaults and *may* be passed into the dataclass' constructor"""
-        return {
-            field.name
-            for field in fields(cls)
-            if field.default is not MISSING or field.default_factory is not MISSING
-        }
+        return cls.OPTIONAL
 
     @classmethod
     def supported_fields(cls):
         """Supported fields are any field that is present in the data model"""
-        return {field.name for field in fields(cls)}
+        return cls.SUPPORTED
 
 
-@dataclass(unsafe_hash=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Group(ModelBase):
-    """internal representation of a group"""
+    """internal representation of a group
+
+    Groups are immutable: they're shared between many Users and live in
+    sets and dict keys throughout the diffing code, so their hash must
+    never change after construction.
+    """
 
     name: str
     description: str = ""
     email: tuple[str] = field(default_factory=tuple)
 
     def __post_init__(self):
-        self.email = tuple(self.email)
+        # Normalising a field on a frozen dataclass has to go through
+        # object.__setattr__
+        object.__setattr__(self, "email", tuple(self.email))
 
 
-@dataclass(unsafe_hash=True, order=True)
+@dataclass(unsafe_hash=True, order=True, slots=True)
 class User(ModelBase):
     """internal representation of a user"""
 
@@ -56,6 +79,35 @@ class User(ModelBase):
     groups: tuple[Group] = field(default_factory=tuple)
     locked: bool = False
 
+    @classmethod
+    def from_canonical(
+        cls,
+        username,
+        *,
+        forename="",
+        surname="",
+        fullname="",
+        email=(),
+        groups=(),
+        locked=False,
+    ):
+        """Builds a User directly, skipping __post_init__ normalisation
+
+        For bulk ingest paths that already supply canonical values — a
+        consistent fullname and tuples for email and groups — this avoids
+        re-deriving names and re-copying tuples once per user.  Callers
+        are responsible for that canonical form.
+        """
+        user = cls.__new__(cls)
+        user.username = username
+        user.forename = forename
+        user.surname = surname
+        user.fullname = fullname
+        user.email = email
+        user.groups = groups
+        user.locked = locked
+        return user
+
     def __post_init__(self):
 
         # this section will get a bit into 'fallacies programmers believe about names'
@@ -66,10 +118,14 @@ class User(ModelBase):
         # should cover almost all our cases.
 
         if self.fullname:
+            # One partition covers both derivations; for a single-word
+            # fullname both forename and surname fall back to that word,
+            # matching the old split()[0]/[-1] behaviour
+            head, sep, tail = self.fullname.partition(" ")
             if not self.forename:
-                self.forename = self.fullname.split(" ", maxsplit=1)[0]
+                self.forename = head
             if not self.surname:
-                self.surname = self.fullname.split(" ", maxsplit=1)[-1]
+                self.surname = tail if sep else head
         else:
             tmp_fullname = []
             if self.forename:
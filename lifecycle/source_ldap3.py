@@ -32,6 +32,10 @@ class SourceLDAP3(SourceBase):
         "group_search_filter": "(objectClass=groupOfNames)",
     }
 
+    def __init__(self, config: Dict):
+        super().__init__(config)
+        self._connection = None
+
     def configure(self, config: Dict):
         if not ("bind_dn" in config and "bind_password" in config) and not config.get(
             "anonymous_bind", False
@@ -43,9 +47,20 @@ class SourceLDAP3(SourceBase):
 
     def connect(self):
         """Connect to LDAP server using current configuration and return the connection"""
-        server = ldap3.Server(self.config["url"])
+        # get_info=NONE skips the schema/DSA-info query ldap3 otherwise
+        # performs on bind; this source only reads a fixed attribute set.
+        # This also makes the configured use_ssl setting actually reach
+        # the server object, which previously ignored it.
+        server = ldap3.Server(
+            self.config["url"],
+            use_ssl=self.config["use_ssl"],
+            get_info=ldap3.NONE,
+        )
         connection = ldap3.Connection(
-            server, user=self.config["bind_dn"], password=self.config["bind_password"]
+            server,
+            user=self.config["bind_dn"],
+            password=self.config["bind_password"],
+            read_only=True,
         )
 
         # We want to ensure that if incorrect credentials are passed in
@@ -55,25 +70,46 @@ class SourceLDAP3(SourceBase):
             raise AuthenticationException("Username or Password not valid")
         return connection
 
-    def fetch(self):
-        """Fetch users / groups from LDAP into lifecycle user and group objects"""
-        self.fetch_users()
-        self.fetch_groups()
+    def _get_connection(self) -> ldap3.Connection:
+        """Return the cached bound connection, creating it on first use
+
+        The bind (plus the TLS handshake with use_ssl) is the expensive
+        part of talking to the server, so one connection persists for the
+        lifetime of the source rather than being set up per operation.
+        """
+        if self._connection is None or self._connection.closed:
+            self._connection = self.connect()
+        return self._connection
 
-    def fetch_users(self, refresh: bool = False) -> Dict[str, User]:
+    def fetch(self):
+        """Fetch users / groups from LDAP into lifecycle user and group objects
+
+        Both fetches share the source's single bound connection; binding
+        per search costs a full round-trip (plus a TLS handshake with
+        use_ssl).
+        """
+        connection = self._get_connection()
+        self.fetch_users(connection=connection)
+        self.fetch_groups(connection=connection)
+
+    def fetch_users(
+        self, refresh: bool = False, connection: ldap3.Connection = None
+    ) -> Dict[str, User]:
         """Load the LDAP users"""
         if not refresh and self.users:
             return self.users
 
-        users = {}
-        connection = self.connect()
+        if connection is None:
+            connection = self._get_connection()
 
-        connection.search(
+        # paged_search streams entries page by page instead of buffering
+        # the whole result set in connection.entries, so memory stays
+        # bounded for large directories
+        entries = connection.extend.standard.paged_search(
             search_base=self.config["base_dn"],
             search_filter=self.config["search_filter"],
             search_scope=ldap3.SUBTREE,
             attributes=[
-                "description",
                 "uid",
                 "mail",
                 "mailAlternateAddress",
@@ -81,29 +117,15 @@ class SourceLDAP3(SourceBase):
                 "givenName",
                 "nsAccountLock",
             ],
+            paged_size=500,
+            generator=True,
         )
 
-        if connection.entries:
-            for ldap_entry in connection.entries:
-                user_account = ldap_entry.entry_attributes_as_dict
-
-                if len(user_account["uid"]) > 0 and len(user_account["mail"]) > 0:
-                    uid = user_account["uid"][0]
-                    ns_account_lock = user_account["nsAccountLock"]
-                    locked = len(ns_account_lock) > 0 and ns_account_lock[0] == "TRUE"
-                    email = tuple(
-                        user_account["mail"]
-                        + user_account.get("mailAlternateAddress", [])
-                    )
-                    user = User(
-                        uid,
-                        forename=user_account["givenName"][0],
-                        surname=user_account["surName"][0],
-                        email=email,
-                        groups=[],
-                        locked=locked,
-                    )
-                    users[uid] = user
+        # dict() over a generator bulk-sizes the hash table and avoids a
+        # Python-level store per entry
+        users = dict(self._entries_to_users(entries))
+
+        if users:
             self.users = users
             logging.debug(users)
             return users
@@ -111,33 +133,85 @@ class SourceLDAP3(SourceBase):
         logging.debug("No user accounts found")
         return {}
 
-    def fetch_groups(self):
+    @staticmethod
+    def _entries_to_users(entries):
+        """Yield (uid, User) pairs for the valid entries of a paged user search"""
+        for ldap_entry in entries:
+            if ldap_entry.get("type", "searchResEntry") != "searchResEntry":
+                continue
+            user_account = ldap_entry["attributes"]
+
+            mail = user_account["mail"]
+            if user_account["uid"] and mail:
+                uid = user_account["uid"][0]
+                ns_account_lock = user_account["nsAccountLock"]
+                locked = bool(ns_account_lock) and ns_account_lock[0] == "TRUE"
+                # Unpacking builds the tuple in one pass, with no
+                # intermediate concatenated list
+                email = (*mail, *user_account.get("mailAlternateAddress", ()))
+                forename = user_account["givenName"][0]
+                surname = user_account["surName"][0]
+                # Everything is already canonical here, so skip the
+                # __post_init__ re-derivation via the fast constructor
+                yield uid, User.from_canonical(
+                    uid,
+                    forename=forename,
+                    surname=surname,
+                    fullname=f"{forename} {surname}".strip(),
+                    email=email,
+                    groups=(),
+                    locked=locked,
+                )
+
+    def fetch_groups(self, connection: ldap3.Connection = None):
         """Load the LDAP groups"""
-        connection = self.connect()
+        # With no users there is nobody to attach groups to, so don't pay
+        # for the search at all
+        if not self.users:
+            logging.debug("No users to attach groups to")
+            return
+
+        if connection is None:
+            connection = self._get_connection()
 
-        connection.search(
+        entries = connection.extend.standard.paged_search(
             search_base=self.config["base_dn"],
             search_filter=self.config["group_search_filter"],
             search_scope=ldap3.SUBTREE,
             attributes=["description", "mail", "member", "cn"],
+            paged_size=500,
+            generator=True,
         )
 
-        if connection.entries:
-            for ldap_entry in connection.entries:
-                ldap_group = ldap_entry.entry_attributes_as_dict
-
-                if len(ldap_group["cn"]) > 0:
-                    name = ldap_group["cn"][0]
-                    if len(ldap_group["description"]) > 0:
-                        description = ldap_group["description"][0]
-                    else:
-                        description = ""
-                    group = Group(name, description, ldap_group["mail"])
-
-                    for member in ldap_group["member"]:
-                        components = member.split(",")
-                        uid = components[0].split("=")[1]
-                        if uid in self.users:
-                            self.users[uid].groups += (group,)
-        else:
+        # Collect each user's groups in a list and freeze to a tuple
+        # once at the end, rather than rebuilding a one-longer tuple
+        # per membership
+        entry_count = 0
+        groups_by_uid = {}
+        users = self.users
+        for ldap_entry in entries:
+            if ldap_entry.get("type", "searchResEntry") != "searchResEntry":
+                continue
+            entry_count += 1
+            ldap_group = ldap_entry["attributes"]
+
+            if ldap_group["cn"]:
+                name = ldap_group["cn"][0]
+                if ldap_group["description"]:
+                    description = ldap_group["description"][0]
+                else:
+                    description = ""
+                group = Group(name, description, ldap_group["mail"])
+
+                for member in ldap_group["member"]:
+                    # Only the value of the first RDN is wanted, so two
+                    # partitions beat building throwaway lists with split
+                    uid = member.partition(",")[0].partition("=")[2]
+                    if uid in users:
+                        groups_by_uid.setdefault(uid, []).append(group)
+
+        for uid, groups in groups_by_uid.items():
+            users[uid].groups += tuple(groups)
+
+        if not entry_count:
             logging.debug("No groups found")
@@ -37,18 +37,10 @@ class SourceStaticConfig(SourceBase):
         self._check_fields(config, self.mandatory_fields, self.optional_fields)
 
         for user in config["users"]:
-            self._check_fields(
-                user,
-                User.mandatory_fields(),
-                User.optional_fields(),
-            )
+            self._check_fields(user, User.MANDATORY, User.OPTIONAL)
 
         for group in config["groups"]:
-            self._check_fields(
-                group,
-                Group.mandatory_fields(),
-                Group.optional_fields(),
-            )
+            self._check_fields(group, Group.MANDATORY, Group.OPTIONAL)
 
         return super().configure(config)
 
@@ -63,31 +55,50 @@ class SourceStaticConfig(SourceBase):
         if not refresh and self.users:
             return self.users
 
-        self.users = {}
-        for config_user in self.config["users"]:
+        self.users = dict(self._config_to_users(self.config["users"]))
+        return self.users
+
+    @staticmethod
+    def _config_to_users(config_users):
+        """Yield (username, User) pairs for each configured user"""
+        optional_fields = User.OPTIONAL - {"groups"}
+        for config_user in config_users:
             username = config_user["username"]
 
+            # Intersecting with the dict's keys runs in C and only visits
+            # fields the entry actually provides
             fields = {
                 field: config_user[field]
-                for field in User.optional_fields()
-                if field in config_user and field != "groups"
+                for field in optional_fields & config_user.keys()
             }
-            self.users[username] = User(username, **fields)
-        return self.users
+            yield username, User(username, **fields)
 
     def fetch_groups(self):
         """Load groups from config and insert them into their relevant Users"""
+        # Invert the user->groups relation once, so each group only walks
+        # its own members instead of re-scanning every user's group list
+        members_by_group = {}
+        for config_user in self.config["users"]:
+            username = config_user["username"]
+            for group_name in config_user["groups"]:
+                members_by_group.setdefault(group_name, []).append(username)
+
+        # Collect each user's groups in a list and freeze to a tuple once,
+        # rather than rebuilding a one-longer tuple per membership
+        groups_by_user = {}
+        optional_fields = Group.OPTIONAL
         for config_group in self.config["groups"]:
             name = config_group["name"]
             fields = {
                 field: config_group[field]
-                for field in Group.optional_fields()
-                if field in config_group
+                for field in optional_fields & config_group.keys()
             }
             group = Group(name, **fields)
 
             # Insert this group into all users that list this group
-            for config_user in self.config["users"]:
-                username = config_user["username"]
-                if name in config_user["groups"]:
-                    self.users[username].groups += (group,)
+            for username in members_by_group.get(name, ()):
+                groups_by_user.setdefault(username, []).append(group)
+
+        for username, groups in groups_by_user.items():
+            user = self.users[username]
+            user.groups += tuple(groups)
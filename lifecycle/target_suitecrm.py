@@ -1,30 +1,100 @@
 """Target for synchronising users and groups to SuiteCRM"""
 
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import json
 import logging
+import os
+import tempfile
+import time
 from typing import Dict
 from urllib.parse import urljoin
 
 import jwt
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+try:
+    # A C JSON parser pays off on the paginated fetches; fall back to
+    # requests' stdlib decoding when it isn't installed
+    import orjson
+except ImportError:
+    orjson = None
 
 from . import TargetBase
 from .model_diff import ModelDifference
 from .models import Group, User
 
 
+logger = logging.getLogger(__name__)
+
+
 class TargetSuiteCRM(TargetBase):
     """Interface for synchronising users and groups to SuiteCRM target"""
 
+    # The instance attributes are this target's caches — token state and
+    # the record-ID maps the sync stages share — plus its session and
+    # worker pool; boxing them into holder objects would only add
+    # indirection
+    # pylint: disable-msg=too-many-instance-attributes
+
     def __init__(self, *args):
         super().__init__(*args)
 
         self._token = None
         self._token_expiry = 0
+        self._auth_header = None
         self._users_data = {}
         self._emails_to_id = {}
         self._groups_to_id = {}
         self._groups_to_attributes = {}
+        self._user_email_ids = {}
+        self._user_group_ids = {}
+
+        # One session for the whole run: TCP (and TLS) connections to the
+        # CRM are kept alive and reused instead of being re-established
+        # for every API call. Transient gateway errors are retried with
+        # backoff rather than failing the whole sync.
+        self._session = requests.Session()
+        workers = self.config["api_concurrency"]
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            # At least as many pooled connections as in-flight requests,
+            # so concurrent calls don't serialise on the pool
+            pool_maxsize=max(32, workers),
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # Per-user API writes are independent of each other and entirely
+        # I/O-bound, so a bounded pool overlaps their network latency
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+
+        # With a token cache configured, short-lived invocations reuse
+        # the previous run's token instead of re-authenticating
+        if "token_cache_path" in self.config:
+            self._load_cached_token()
+
+    def close(self):
+        """Dispose of the worker pool and the pooled API connections"""
+        self._executor.shutdown()
+        self._session.close()
+
+    def _run_concurrently(self, function, items):
+        """Run function(item) for every item, overlapping the API latency
+
+        Results are discarded.  Every submitted call runs to completion,
+        then the first exception (in submission order) propagates.
+        """
+        futures = [self._executor.submit(function, item) for item in items]
+        for future in futures:
+            future.result()
 
     mandatory_fields = {
         "url",
@@ -36,6 +106,9 @@ class TargetSuiteCRM(TargetBase):
 
     optional_fields = {
         "api_page_size",
+        "api_concurrency",
+        "api_bulk_operations",
+        "token_cache_path",
         "stages",
         "users_cleanup",
         "excluded_usernames",
@@ -59,11 +132,20 @@ class TargetSuiteCRM(TargetBase):
 
     default_config = {
         "api_page_size": 20,
+        "api_concurrency": 8,
+        "api_bulk_operations": False,
         "stages": ["users_create", "users_sync", "users_disable", "users_cleanup"],
         "excluded_usernames": [],
         "delete_absent_users": True,
     }
 
+    def configure(self, config: Dict) -> Dict:
+        config = super().configure(config)
+        # Every per-user stage checks membership of this; a frozenset
+        # keeps that O(1) however long the exclusion list grows
+        config["excluded_usernames"] = frozenset(config["excluded_usernames"])
+        return config
+
     def process_groups_patterns(self, groups_patterns: list[str]) -> list[str]:
         """Add the groups required by suitecrm config"""
 
@@ -87,20 +169,70 @@ class TargetSuiteCRM(TargetBase):
                 "password": self.config["api_password"],
             },
         )
-        logging.debug("Authentication response '%s'", response.text)
+        logger.debug("Authentication response '%s'", response.text)
 
         self._token = response.json()["access_token"]
-        self._token_expiry = jwt.decode(
-            self._token, options={"verify_signature": False}
-        )["exp"]
+        self._token_expiry = int(
+            jwt.decode(self._token, options={"verify_signature": False})["exp"]
+        )
+        self._build_auth_header()
+        if "token_cache_path" in self.config:
+            self._store_cached_token()
         return self._token
 
+    def _build_auth_header(self):
+        """Rebuild the cached headers for authenticated requests
+
+        Only called when the token rotates, so _request doesn't allocate
+        a fresh three-key dict per call.
+        """
+        self._auth_header = {
+            "Content-type": "application/vnd.api+json",
+            "Accept": "application/vnd.api+json",
+            "Authorization": f"Bearer {self._token}",
+        }
+
+    def _load_cached_token(self):
+        """Load a previously-cached access token, ignoring any failure
+
+        An unusable cache just means authenticating as normal; an expired
+        token is caught by _token_invalid.
+        """
+        try:
+            with open(self.config["token_cache_path"], encoding="utf-8") as cache_file:
+                cached = json.load(cache_file)
+            self._token = cached["token"]
+            self._token_expiry = int(cached["exp"])
+            self._build_auth_header()
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def _store_cached_token(self):
+        """Atomically write the current access token next to its expiry
+
+        A cache write failure is never fatal; we already hold a valid
+        token in memory.
+        """
+        cache_path = self.config["token_cache_path"]
+        try:
+            cache_dir = os.path.dirname(cache_path) or "."
+            with tempfile.NamedTemporaryFile(
+                mode="w", dir=cache_dir, delete=False
+            ) as tmp_file:
+                json.dump({"token": self._token, "exp": self._token_expiry}, tmp_file)
+            # The token grants API access, so keep it owner-only
+            os.chmod(tmp_file.name, 0o600)
+            os.replace(tmp_file.name, cache_path)
+        except OSError as exc:
+            logger.debug("Couldn't write token cache: %s", str(exc))
+
     def _token_invalid(self):
         """Check token expiration is not imminent"""
-        # Invalidate a minute prior to expiration.
-        return (
-            self._token is None or self._token_expiry + 60 < datetime.now().timestamp()
-        )
+        # Invalidate a minute prior to expiration, so in-flight requests
+        # don't race the token's expiry.  time.time() is already POSIX
+        # seconds, the same clock as the JWT exp claim, and much cheaper
+        # than building a datetime per check.
+        return self._token is None or self._token_expiry - 60 < time.time()
 
     def _get_token(self):
         """Return a valid access token for the SuiteCRM API"""
@@ -108,42 +240,99 @@ class TargetSuiteCRM(TargetBase):
             return self._authenticate()
         return self._token
 
+    def _get_auth_header(self):
+        """Return the cached authenticated-request headers, refreshing
+        the token first if its expiry is imminent
+        """
+        if self._token_invalid():
+            self._authenticate()
+        return self._auth_header
+
     def _request(self, endpoint: str, method: str = "GET", auth: bool = True, **kwargs):
         """Wrapper around request for interacting with the SuiteCRM API"""
         url = urljoin(self.config["url"], endpoint)
         headers = kwargs.pop("headers", {})
         if auth:
-            headers.update(
-                {
-                    "Content-type": "application/vnd.api+json",
-                    "Accept": "application/vnd.api+json",
-                    "Authorization": f"Bearer {self._get_token()}",
-                }
-            )
-        logging.debug("HTTP Request JSON (if any):  %s", kwargs.get("json", ""))
-        logging.debug("SuiteCRM url is: '%s'", url)
-        response = requests.request(
+            auth_header = self._get_auth_header()
+            # The cached dict is passed through as-is in the common case
+            # of no caller-supplied headers
+            headers = {**headers, **auth_header} if headers else auth_header
+        # This runs once per API call, so don't even format the debug
+        # arguments unless debug logging is switched on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("HTTP Request JSON (if any):  %s", kwargs.get("json", ""))
+            logger.debug("SuiteCRM url is: '%s'", url)
+        response = self._session.request(
             method, url, headers=headers, timeout=30, **kwargs, allow_redirects=False
         )
         response.raise_for_status()
         return response
 
-    def _iter_pages(self, endpoint: str, page: int = 1):
-        """Generator for handling paginated responses from the SuiteCRM API"""
-        params = {
+    def _fetch_page(self, endpoint: str, page: int, params: dict = None) -> dict:
+        """Fetch one page of a paginated endpoint and return the parsed body"""
+        page_params = {
             "page[size]": self.config["api_page_size"],
             "page[number]": page,
         }
-        _json = self._request(endpoint, params=params).json()
+        if params:
+            page_params.update(params)
+        response = self._request(endpoint, params=page_params)
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+    @staticmethod
+    def _total_pages(_json: dict) -> int:
+        # if you request something that's empty, you get nothing
+        # but it's hard to guess ahead-of-time whether it'll be empty
+        return _json["meta"].get("total-pages", 1)
+
+    def _iter_pages(self, endpoint: str, params: dict = None, included: list = None):
+        """Generator for handling paginated responses from the SuiteCRM API
+
+        Extra query parameters can be passed via ``params``.  If
+        ``included`` is a list, any sideloaded entries in the responses
+        are appended to it as the pages are consumed.
+        """
+        # A while loop rather than recursion: frames don't pile up with
+        # the page count, however large the module is
+        page = 1
+        while True:
+            _json = self._fetch_page(endpoint, page, params)
+            if included is not None:
+                included.extend(_json.get("included", ()))
+            yield from _json["data"]
+
+            if page >= self._total_pages(_json):
+                return
+            page += 1
+
+    def _iter_pages_parallel(
+        self, endpoint: str, params: dict = None, included: list = None
+    ):
+        """Like _iter_pages, but with the remaining pages fetched concurrently
+
+        Page 1 is fetched alone to learn the page count, then the rest
+        are spread over the worker pool and yielded in page order.  Only
+        for use from the main thread: a call from one of the pool's own
+        workers could deadlock waiting for a free worker.
+        """
+        _json = self._fetch_page(endpoint, 1, params)
+        if included is not None:
+            included.extend(_json.get("included", ()))
         yield from _json["data"]
 
-        if "total-pages" in _json["meta"]:
-            # if you request something that's empty, you get nothing
-            # but it's hard to guess ahead-of-time whether it'll be empty
-            total_pages = _json["meta"]["total-pages"]
-            if page < total_pages:
-                page += 1
-                yield from self._iter_pages(endpoint, page)
+        total_pages = self._total_pages(_json)
+        if total_pages <= 1:
+            return
+
+        pages = range(2, total_pages + 1)
+        for _json in self._executor.map(
+            lambda page: self._fetch_page(endpoint, page, params), pages
+        ):
+            if included is not None:
+                included.extend(_json.get("included", ()))
+            yield from _json["data"]
 
     def _user_relationship_endpoint(self, username: str, relationship_type: str) -> str:
         """Returns the API endpoint for the relationship of a given type to a given user"""
@@ -157,16 +346,14 @@ class TargetSuiteCRM(TargetBase):
 
         return ""
 
-    def _fetch_raw_relations_for_user(
-        self, username: str, relationship_type: str
-    ) -> dict:
-        """Returns the raw entries of a given type related to a given user"""
+    def _fetch_raw_relations_for_user(self, username: str, relationship_type: str):
+        """Iterates the raw entries of a given type related to a given user"""
 
         endpoint = self._user_relationship_endpoint(username, relationship_type)
         if endpoint:
-            return list(self._iter_pages(endpoint))
+            return self._iter_pages(endpoint)
 
-        return {}
+        return ()
 
     def _fetch_raw_emails_for_user(self, username: str) -> dict:
         """Takes a username and fetches any extra E-mail addresses, returning the raw dict"""
@@ -182,14 +369,20 @@ class TargetSuiteCRM(TargetBase):
             ent["attributes"]["email_address"]
             for ent in self._fetch_raw_emails_for_user(username)
         )
-        logging.debug("E-mails fetched for user '%s': '%s'", username, emails)
+        logger.debug("E-mails fetched for user '%s': '%s'", username, emails)
 
         return emails
 
     def _fetch_emails_with_id_for_user(self, username: str) -> dict[str, str]:
         """Takes a username and fetches any extra E-mail addresses,
         returning a dict of email address to ID
+
+        Users whose relations were sideloaded by fetch_users are answered
+        from the in-memory map without another round trip.
         """
+        cached = self._user_email_ids.get(username)
+        if cached is not None:
+            return cached
         return {
             ent["attributes"]["email_address"]: ent["id"]
             for ent in self._fetch_raw_emails_for_user(username)
@@ -210,11 +403,34 @@ class TargetSuiteCRM(TargetBase):
         return groups
 
     def _fetch_groups_with_id_for_user(self, username: str) -> dict[str, str]:
+        cached = self._user_group_ids.get(username)
+        if cached is not None:
+            return cached
         return {
             ent["attributes"]["name"]: ent["id"]
             for ent in self._fetch_raw_relations_for_user(username, "SecurityGroups")
         }
 
+    @staticmethod
+    def _sideloaded_relations(obj: dict, relationship_type: str, included_by_ref: dict):
+        """Resolve a user's relationship from sideloaded entries
+
+        Returns the related entries, or None when the server didn't
+        honour the ``include`` parameter for this relationship, in which
+        case the caller falls back to fetching it separately.
+        """
+        relationship = obj["relationships"].get(relationship_type)
+        if not relationship or "data" not in relationship:
+            return None
+
+        entries = []
+        for ref in relationship["data"]:
+            entry = included_by_ref.get((ref["type"], ref["id"]))
+            if entry is None:
+                return None
+            entries.append(entry)
+        return entries
+
     def fetch_users(self, refresh: bool = False) -> Dict[str, User]:
         """Load the SuiteCRM users"""
         if not refresh and self.users:
@@ -222,15 +438,58 @@ class TargetSuiteCRM(TargetBase):
 
         users = {}
         self._users_data = {}
+        self._user_email_ids = {}
+        self._user_group_ids = {}
+
+        # Ask the server to sideload each user's E-mail addresses and
+        # security groups into the same responses; one paged walk then
+        # replaces two extra per-user round trips.
+        included = []
+        included_by_ref = {}
+        indexed = 0
+
+        for obj in self._iter_pages_parallel(
+            "/Api/V8/module/Users",
+            params={"include": "EmailAddress,SecurityGroups"},
+            included=included,
+        ):
+            # Sideloaded entries arrive page by page ahead of their
+            # users; index the new arrivals before resolving against them
+            while indexed < len(included):
+                ent = included[indexed]
+                included_by_ref[(ent["type"], ent["id"])] = ent
+                indexed += 1
 
-        _json = list(self._iter_pages("/Api/V8/module/Users"))
-
-        for obj in _json:
             attributes = obj["attributes"]
             username = attributes["user_name"]
             self._users_data[username] = obj
-            emails = self._fetch_emails_for_user(username)
-            groups = self._fetch_groups_for_user(username)
+
+            entries = self._sideloaded_relations(obj, "EmailAddress", included_by_ref)
+            if entries is not None:
+                emails = tuple(ent["attributes"]["email_address"] for ent in entries)
+                # Keep the per-user IDs too, so the sync stages don't
+                # have to re-fetch this user's relations
+                self._user_email_ids[username] = {
+                    ent["attributes"]["email_address"]: ent["id"] for ent in entries
+                }
+            else:
+                emails = self._fetch_emails_for_user(username)
+
+            entries = self._sideloaded_relations(obj, "SecurityGroups", included_by_ref)
+            if entries is not None:
+                groups = tuple(
+                    Group(
+                        ent["attributes"]["name"],
+                        description=ent["attributes"].get("description", None),
+                    )
+                    for ent in entries
+                )
+                self._user_group_ids[username] = {
+                    ent["attributes"]["name"]: ent["id"] for ent in entries
+                }
+            else:
+                groups = self._fetch_groups_for_user(username)
+
             user = User(
                 username=username,
                 forename=attributes["first_name"],
@@ -242,7 +501,7 @@ class TargetSuiteCRM(TargetBase):
             )
             users[username] = user
 
-        logging.debug("Users fetched from server: '%s'", users)
+        logger.debug("Users fetched from server: '%s'", users)
         self.users = users
         return users
 
@@ -250,14 +509,13 @@ class TargetSuiteCRM(TargetBase):
         if not refresh and self._emails_to_id:
             return self._emails_to_id
 
-        emails_json = list(self._iter_pages("/Api/V8/module/EmailAddress"))
         self._emails_to_id = {}
-        for ent in emails_json:
+        for ent in self._iter_pages_parallel("/Api/V8/module/EmailAddress"):
             address = ent["attributes"]["email_address"]
             _id = ent["id"]
             if address in self._emails_to_id:
                 if not refresh:
-                    logging.warning(
+                    logger.warning(
                         (
                             "Duplicate E-mail address entries found in suitecrm server:"
                             "Address '%s' has IDs '%s' and '%s'. Using the first one only."
@@ -274,16 +532,14 @@ class TargetSuiteCRM(TargetBase):
         if not refresh and self._groups_to_id:
             return self._groups_to_id
 
-        groups_json = list(self._iter_pages("/Api/V8/module/SecurityGroup"))
-
         self._groups_to_id = {}
         self._groups_to_attributes = {}
-        for ent in groups_json:
+        for ent in self._iter_pages_parallel("/Api/V8/module/SecurityGroup"):
             groupname = ent["attributes"]["name"]
             _id = ent["id"]
             if groupname in self._groups_to_id:
                 if not refresh:
-                    logging.warning(
+                    logger.warning(
                         (
                             "Duplicate Group entries found in suitecrm server:"
                             "Group '%s' has IDs '%s' and '%s'. Using the first one only."
@@ -298,7 +554,7 @@ class TargetSuiteCRM(TargetBase):
         return self._groups_to_id
 
     def _create_group(self, group: Group):
-        logging.debug("Creating new Security Group for group named '%s'", group.name)
+        logger.debug("Creating new Security Group for group named '%s'", group.name)
         new_group = {
             "data": {
                 "type": "SecurityGroup",
@@ -310,11 +566,8 @@ class TargetSuiteCRM(TargetBase):
         }
         self._request("/Api/V8/module", method="POST", json=new_group)
 
-    def _update_group(self, group: Group):
-        logging.debug("Updating Security Group named '%s'", group.name)
-        crm_groups = self._fetch_all_groups()
-        group_id = crm_groups[group.name]
-        # How do I get the group ID?
+    def _update_group(self, group: Group, group_id: str):
+        logger.debug("Updating Security Group named '%s'", group.name)
         updated_group = {
             "data": {
                 "type": "SecurityGroup",
@@ -343,48 +596,110 @@ class TargetSuiteCRM(TargetBase):
         names_to_ids = self._fetch_all_groups()
         all_groups = set()
         for user in users:
-            if user.groups:
-                all_groups |= set(user.groups)
+            # update() consumes the tuple directly, with no intermediate
+            # set allocation per user
+            all_groups.update(user.groups)
 
+        changed = False
         for group in all_groups:
             if group.name in names_to_ids:
                 if self._group_differs(group, self._groups_to_attributes[group.name]):
-                    self._update_group(group)
+                    # The ID is already in scope; don't re-look the map up
+                    self._update_group(group, names_to_ids[group.name])
+                    changed = True
             else:
                 self._create_group(group)
+                changed = True
 
-        self._fetch_all_groups(refresh=True)
+        # The refetch only exists to pick up what we just wrote; when
+        # nothing was written the cached maps are still current and a
+        # full SecurityGroup scan would be wasted
+        if changed:
+            self._fetch_all_groups(refresh=True)
 
     def _add_missing_emails(self, users: list[User]):
         emails_to_id = self._fetch_all_emails()
 
         emails = set()
         for user in users:
-            emails |= set(user.email)
+            emails.update(user.email)
+
+        # The dict's keys view subtracts in C without copying to a set
+        missing_emails = emails - emails_to_id.keys()
+        if not missing_emails:
+            # Nothing to create, so the cached address map is still
+            # current — skip the full EmailAddress rescan.  This is the
+            # common case the second time a run gets here (users_create
+            # has already filled any gaps before users_sync).
+            return
+
+        email_records = [
+            {"type": "EmailAddress", "attributes": {"email_address": mail}}
+            for mail in missing_emails
+        ]
+        if not self._bulk_request(email_records, "POST"):
+            self._run_concurrently(self._create_email, missing_emails)
 
-        missing_emails = set(emails) - set(emails_to_id.keys())
+        self._fetch_all_emails(refresh=True)
 
-        for mail in missing_emails:
-            logging.debug("Creating new E-mail entry for address '%s'", mail)
-            new_mail = {
-                "data": {
-                    "type": "EmailAddress",
-                    "attributes": {
-                        "email_address": mail,
-                    },
-                }
-            }
-            self._request("/Api/V8/module", method="POST", json=new_mail)
+    def _bulk_request(self, records: list, method: str) -> bool:
+        """Submit records to the bulk endpoint in page-sized chunks, if enabled
 
-        self._fetch_all_emails(refresh=True)
+        Returns True when the server accepted the bulk requests.  When
+        bulk operations are disabled, or the server answers the first
+        chunk with 404/405 (no bulk extension), returns False so the
+        caller falls back to per-record requests.  A failure on a later
+        chunk re-raises instead: earlier chunks have already been
+        committed, so re-sending everything per-record would duplicate
+        them.
+        """
+        if not records or not self.config["api_bulk_operations"]:
+            return False
+
+        chunk_size = self.config["api_page_size"]
+        for start in range(0, len(records), chunk_size):
+            payload = {"data": records[start : start + chunk_size]}
+            try:
+                self._request("/Api/V8/module/bulk", method=method, json=payload)
+            except requests.HTTPError as http_error:
+                response = http_error.response
+                if (
+                    start == 0
+                    and response is not None
+                    and response.status_code in (404, 405)
+                ):
+                    logger.debug("Server doesn't support bulk operations, falling back")
+                    return False
+                raise
+        return True
+
+    def _post_record(self, record: dict):
+        logger.debug("Creating record: '%s'", record)
+        self._request("/Api/V8/module", method="POST", json={"data": record})
+
+    def _patch_record(self, record: dict):
+        logger.debug("Patching record: '%s'", record)
+        self._request("/Api/V8/module", method="PATCH", json={"data": record})
+
+    def _create_email(self, mail: str):
+        logger.debug("Creating new E-mail entry for address '%s'", mail)
+        new_mail = {
+            "data": {
+                "type": "EmailAddress",
+                "attributes": {
+                    "email_address": mail,
+                },
+            }
+        }
+        self._request("/Api/V8/module", method="POST", json=new_mail)
 
-    def _assign_group(self, username, group: Group):
-        logging.debug("Assigning Group '%s' to user '%s'", group.name, username)
+    def _assign_group(self, username, group: Group, group_id: str):
+        logger.debug("Assigning Group '%s' to user '%s'", group.name, username)
         user_id = self._users_data[username]["id"]
         new_relationship = {
             "data": {
                 "type": "SecurityGroup",
-                "id": self._groups_to_id[group.name],
+                "id": group_id,
             }
         }
         self._request(
@@ -394,7 +709,7 @@ class TargetSuiteCRM(TargetBase):
         )
 
     def _unassign_group(self, group_id, username):
-        logging.debug("Unassigning Group '%s' from user '%s'", group_id, username)
+        logger.debug("Unassigning Group '%s' from user '%s'", group_id, username)
         user_id = self._users_data[username]["id"]
         self._request(
             f"/Api/V8/module/Users/{user_id}/relationships/SecurityGroups/{group_id}",
@@ -402,7 +717,7 @@ class TargetSuiteCRM(TargetBase):
         )
 
     def _assign_email(self, mail, username):
-        logging.debug("Assigning E-mail '%s' to user '%s'", mail, username)
+        logger.debug("Assigning E-mail '%s' to user '%s'", mail, username)
         # Create relationship, this user to that E-mail address.
         user_id = self._users_data[username]["id"]
         new_relationship = {
@@ -418,7 +733,7 @@ class TargetSuiteCRM(TargetBase):
         )
 
     def _unassign_email(self, mail_id, username):
-        logging.debug("Unassigning E-mail '%s' from user '%s'", mail_id, username)
+        logger.debug("Unassigning E-mail '%s' from user '%s'", mail_id, username)
         user_id = self._users_data[username]["id"]
         self._request(
             f"/Api/V8/module/Users/{user_id}/relationships/email_addresses/{mail_id}",
@@ -429,27 +744,35 @@ class TargetSuiteCRM(TargetBase):
         user_groups = {group.name for group in user.groups}
         return user_groups & set(self.config.get("admin_groups", []))
 
+    def _user_create_record(self, user: User) -> dict:
+        return {
+            "type": "User",
+            "attributes": {
+                "user_name": user.username,
+                "first_name": user.forename,
+                "last_name": user.surname,
+                "external_auth_only": 1,
+                "email1": user.email[0] if user.email else "",
+                "status": "Inactive" if user.locked else "Active",
+                "is_admin": "1" if self._user_is_admin(user) else "0",
+            },
+        }
+
+    def _link_new_user(self, user: User):
+        """Link a freshly-created user to its E-mail addresses and groups"""
+        for mail in user.email[1:]:
+            self._assign_email(mail, user.username)
+
+        groups_to_ids = self._groups_to_id
+        for group in user.groups:
+            self._assign_group(user.username, group, groups_to_ids[group.name])
+
     def users_create(self, diff: ModelDifference):
         """Create any users missing from the target"""
 
-        for user in diff.added_users.values():
-            new_user = {
-                "data": {
-                    "type": "User",
-                    "attributes": {
-                        "user_name": user.username,
-                        "first_name": user.forename,
-                        "last_name": user.surname,
-                        "external_auth_only": 1,
-                        "email1": user.email[0] if user.email else "",
-                        "status": "Inactive" if user.locked else "Active",
-                        "is_admin": "1" if self._user_is_admin(user) else "0",
-                    },
-                }
-            }
-            logging.debug("Creating user: '%s'", user)
-            self._request("/Api/V8/module", method="POST", json=new_user)
-            logging.debug("User created successfully")
+        records = [self._user_create_record(user) for user in diff.added_users.values()]
+        if not self._bulk_request(records, "POST"):
+            self._run_concurrently(self._post_record, records)
 
         # Refresh users so we have the new users' IDs.
         self.fetch_users(refresh=True)
@@ -457,14 +780,9 @@ class TargetSuiteCRM(TargetBase):
         self._sync_groups(diff.added_users.values())
 
         self._add_missing_emails(diff.added_users.values())
-        for user in diff.added_users.values():
-            # Link E-mail addresses to our new users
-            for mail in user.email[1:]:
-                self._assign_email(mail, user.username)
-
-            # Link SecurityGroups to our new users
-            for group in user.groups:
-                self._assign_group(user.username, group)
+        # Links to different users are independent, so fan them out per
+        # user; within one user the calls stay ordered
+        self._run_concurrently(self._link_new_user, diff.added_users.values())
 
     def users_cleanup(self, diff: ModelDifference):
         """Remove any users missing from the source
@@ -475,128 +793,181 @@ class TargetSuiteCRM(TargetBase):
         """
 
         self.fetch_users()
-        logging.debug("Started cleaning users")
-        logging.debug("Excluded usernames: %s", self.config["excluded_usernames"])
+        logger.debug("Started cleaning users")
+        logger.debug("Excluded usernames: %s", self.config["excluded_usernames"])
+        records = []
         for user in diff.removed_users.values():
-            _id = self._users_data[user.username]["id"]
-            if self.config["delete_absent_users"]:
+            record = self._user_cleanup_record(user)
+            if record is not None:
+                records.append(record)
+
+        if not self._bulk_request(records, "PATCH"):
+            self._run_concurrently(self._patch_record, records)
+
+    def _user_cleanup_record(self, user: User):
+        """Build the deletion/disablement record for a removed user
+
+        Returns None when the user is excluded from cleanup or already in
+        the wanted state.
+        """
+        _id = self._users_data[user.username]["id"]
+        if self.config["delete_absent_users"]:
+            if user.username not in self.config["excluded_usernames"]:
+                logger.debug("Deleting user: %s", user.username)
+                return {
+                    "type": "User",
+                    "id": _id,
+                    "attributes": {
+                        "deleted": 1,
+                    },
+                }
+            logger.debug(
+                "Not attempting to delete %s as they are in excluded_usernames",
+                user.username,
+            )
+        else:
+            if not user.locked:
                 if user.username not in self.config["excluded_usernames"]:
-                    logging.debug(
-                        "Attempting to delete %s.",
-                        user.username,
-                    )
-                    deletion_record = {
-                        "data": {
-                            "type": "User",
-                            "id": _id,
-                            "attributes": {
-                                "deleted": 1,
-                            },
-                        }
+                    logger.debug("Disabling account for %s", user.username)
+                    return {
+                        "type": "User",
+                        "id": _id,
+                        "attributes": {
+                            "status": "Inactive",
+                        },
                     }
-                    logging.debug("Deleting user: %s", user.username)
-                    self._request(
-                        "/Api/V8/module", method="PATCH", json=deletion_record
-                    )
-                else:
-                    logging.debug(
-                        "Not attempting to delete %s as they are in excluded_usernames",
-                        user.username,
-                    )
+                logger.debug(
+                    "Not attempting to disable %s as they are in excluded_usernames",
+                    user.username,
+                )
             else:
-                if not user.locked:
-                    if user.username not in self.config["excluded_usernames"]:
-                        logging.debug("Attempting to disable: %s.", user.username)
-                        disablement_record = {
-                            "data": {
-                                "type": "User",
-                                "id": _id,
-                                "attributes": {
-                                    "status": "Inactive",
-                                },
-                            }
-                        }
-                        logging.debug("Disabling account for %s", user.username)
-                        self._request(
-                            "/Api/V8/module", method="PATCH", json=disablement_record
-                        )
-                    else:
-                        logging.debug(
-                            "Not attempting to disable %s as they are in excluded_usernames",
-                            user.username,
-                        )
-                else:
-                    logging.debug(
-                        "Not attempting to disable %s as they are already locked",
-                        user.username,
-                    )
+                logger.debug(
+                    "Not attempting to disable %s as they are already locked",
+                    user.username,
+                )
+        return None
 
     def _sync_emails_for_users(self, diff: ModelDifference):
-        for user in diff.changed_users.values():
-            if user.username in self.config["excluded_usernames"]:
+        # Work out every user's added/removed addresses up front — pure
+        # dict and set work — then fire only the users with changes at
+        # the API
+        excluded = self.config["excluded_usernames"]
+        source_users = diff.source_users
+        target_users = diff.target_users
+        changes = []
+        for username in diff.changed_users:
+            if username in excluded:
                 continue
-
-            source_emails = set(diff.source_users[user.username].email)
-            target_emails = set(diff.target_users[user.username].email)
+            source_emails = frozenset(source_users[username].email)
+            target_emails = frozenset(target_users[username].email)
             if source_emails == target_emails:
                 # Nothing to do
                 continue
+            changes.append(
+                (username, source_emails - target_emails, target_emails - source_emails)
+            )
 
-            added_emails = source_emails - target_emails
-            for mail in added_emails:
-                self._assign_email(mail, user.username)
+        self._run_concurrently(
+            lambda change: self._apply_email_change(*change), changes
+        )
+
+    def _apply_email_change(self, username: str, added_emails, removed_emails):
+        for mail in added_emails:
+            self._assign_email(mail, username)
 
-            removed_emails = target_emails - source_emails
+        if removed_emails:
             # It's possible to have multiple entries in the EmailAddress module
             # that have the same E-mail address but different ID. Use the list
             # of E-mails for this user to get the right ID.
-            mails_to_ids = self._fetch_emails_with_id_for_user(user.username)
+            mails_to_ids = self._fetch_emails_with_id_for_user(username)
             for mail in removed_emails:
-                self._unassign_email(mails_to_ids[mail], user.username)
+                self._unassign_email(mails_to_ids[mail], username)
 
     def _sync_group_membership_for_users(self, diff: ModelDifference):
-        for user in diff.changed_users.values():
-            if user.username in self.config["excluded_usernames"]:
+        excluded = self.config["excluded_usernames"]
+        target_users = diff.target_users
+        changes = []
+        for username, user in diff.changed_users.items():
+            if username in excluded:
                 continue
-
-            changed_groups = set(diff.changed_users[user.username].groups)
-            target_groups = set(diff.target_users[user.username].groups)
+            changed_groups = frozenset(user.groups)
             # target_groups is already merged based on groups_patterns
+            target_groups = frozenset(target_users[username].groups)
             if changed_groups == target_groups:
                 # Nothing about group membership changed in this User
                 continue
+            changes.append((username, changed_groups, target_groups))
+
+        self._run_concurrently(
+            lambda change: self._apply_group_membership_change(*change), changes
+        )
+
+    def _apply_group_membership_change(
+        self, username: str, changed_groups, target_groups
+    ):
+        # Remove all then re-add to enforce ordering
+        groups_to_ids = self._fetch_groups_with_id_for_user(username)
+        for group in target_groups:
+            self._unassign_group(groups_to_ids[group.name], username)
+
+        all_groups_to_ids = self._groups_to_id
+        for group in changed_groups:
+            self._assign_group(username, group, all_groups_to_ids[group.name])
+
+    def _user_record_attributes(self, user: User) -> dict:
+        """Map a User onto the attribute block of its SuiteCRM record"""
+        return {
+            "user_name": user.username,
+            "first_name": user.forename,
+            "last_name": user.surname,
+            "email1": user.email[0] if user.email else "",
+            "status": "Inactive" if user.locked else "Active",
+            "is_admin": "1" if self._user_is_admin(user) else "0",
+        }
 
-            # Remove all then re-add to enforce ordering
-            groups_to_ids = self._fetch_groups_with_id_for_user(user.username)
-            for group in target_groups:
-                self._unassign_group(groups_to_ids[group.name], user.username)
+    def _user_update_record(self, user: User, diff: ModelDifference):
+        """Build the PATCH record for a changed user
 
-            for group in changed_groups:
-                self._assign_group(user.username, group)
+        Returns None when the user is excluded, or when no record
+        attribute actually differs from the target's current state — a
+        user whose only change was groups or extra E-mail addresses
+        needs no PATCH at all.  Only the differing attributes are sent.
+        """
+        if user.username in self.config["excluded_usernames"]:
+            return None
+
+        attributes = self._user_record_attributes(user)
+        target_attributes = self._user_record_attributes(
+            diff.target_users[user.username]
+        )
+        changed_attributes = {
+            key: value
+            for key, value in attributes.items()
+            if value != target_attributes[key]
+        }
+        if not changed_attributes:
+            logger.debug("No record changes for user '%s'", user.username)
+            return None
+
+        logger.info("Updating user '%s'", user.username)
+        return {
+            "type": "User",
+            "id": self._users_data[user.username]["id"],
+            "attributes": changed_attributes,
+        }
 
     def users_sync(self, diff: ModelDifference):
         """Sync the existing users with their values from the source"""
 
         self.fetch_users()
+        records = []
         for user in diff.changed_users.values():
-            _id = self._users_data[user.username]["id"]
-            if user.username not in self.config["excluded_usernames"]:
-                updated_record = {
-                    "data": {
-                        "type": "User",
-                        "id": _id,
-                        "attributes": {
-                            "user_name": user.username,
-                            "first_name": user.forename,
-                            "last_name": user.surname,
-                            "email1": user.email[0] if user.email else "",
-                            "status": "Inactive" if user.locked else "Active",
-                            "is_admin": "1" if self._user_is_admin(user) else "0",
-                        },
-                    }
-                }
-                logging.info("Updating user '%s'", user.username)
-                self._request("/Api/V8/module", method="PATCH", json=updated_record)
+            record = self._user_update_record(user, diff)
+            if record is not None:
+                records.append(record)
+
+        if not self._bulk_request(records, "PATCH"):
+            self._run_concurrently(self._patch_record, records)
 
         # Add to suitecrm all E-mail addresses that have been added but don't exist
         self._add_missing_emails(diff.changed_users.values())
@@ -6,7 +6,7 @@ from setuptools import find_packages, setup
 setup(
     name="lifecycle",
     packages=find_packages(exclude=("tests", "tests.*")),
-    install_requires=["addict", "ldap3", "PyJWT", "pyyaml", "requests"],
+    install_requires=["ldap3", "PyJWT", "pyyaml", "requests"],
     extras_require={
         "dev": [
             "pre-commit",
@@ -18,7 +18,7 @@ setup(
             "black",
         ],
     },
-    python_requires=">=3.7",
+    python_requires=">=3.10",
     package_dir={"lifecycle": "lifecycle"},
     entry_points={
         "console_scripts": [
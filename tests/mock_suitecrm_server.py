@@ -1,6 +1,7 @@
 """Tools for a mock SuiteCRM server to use when testing"""
 
 
+import copy
 from datetime import datetime, timedelta
 import json
 import math
@@ -22,6 +23,9 @@ class MockSuiteCRMServer:
 
     def __init__(self, data: list[dict] = None):
         self.id_index = 0
+        # Number of authentication requests served, so tests can assert
+        # whether a target (re-)authenticated
+        self.auth_requests = 0
         if data is None:
             self.data = []
 
@@ -222,6 +226,44 @@ class MockSuiteCRMServer:
             "data": returned_data,
         }
 
+    def sideload_relationships(self, response: dict, relationship_types: list[str]):
+        """Mimics JSON:API ``?include=`` sideloading for a module response
+
+        Each returned entry gains a relationships "data" array for the
+        requested types, and the related entries are collected into the
+        response's "included" list.
+        """
+        # include= uses the relationship names, which differ from the
+        # names the relationships are stored under
+        storage_names = {
+            "EmailAddress": "email_addresses",
+            "SecurityGroups": "SecurityGroups",
+        }
+        included = {}
+        data = []
+        for entry in response["data"]:
+            if "_relationships" not in entry:
+                data.append(entry)
+                continue
+
+            entry = copy.deepcopy(entry)
+            for relationship_type in relationship_types:
+                storage_name = storage_names.get(relationship_type)
+                if storage_name is None or storage_name not in entry["_relationships"]:
+                    continue
+
+                refs = []
+                related_ids = entry["_relationships"][storage_name]
+                for related in self.search_by_ids(related_ids):
+                    refs.append({"type": related["type"], "id": related["id"]})
+                    included[(related["type"], related["id"])] = related
+                entry["relationships"].setdefault(relationship_type, {})["data"] = refs
+            data.append(entry)
+
+        response["data"] = data
+        response["included"] = list(included.values())
+        return response
+
     @staticmethod
     def mock_response(data=None, exception=None):
         """Generates a MagicMock that can be treated as a ``requests.response``"""
@@ -231,9 +273,11 @@ class MockSuiteCRMServer:
         if data:
             response.json.return_value = data
             response.text = json.dumps(data, indent=2)
+            response.content = response.text.encode()
         else:
             response.json.side_effect = ValueError()
             response.text = ""
+            response.content = b""
 
         if exception:
             response.raise_for_status.side_effect = exception
@@ -288,9 +332,11 @@ class MockSuiteCRMServer:
             # /Api/V8/module/<modulename>, i.e. get all entries for that module
             module_name = self.map_module(query[3])
             found_modules = self.search_by_type(module_name)
-            return self.mock_response(
-                self.module_response_data(found_modules, **kwargs)
-            )
+            response = self.module_response_data(found_modules, **kwargs)
+            include = kwargs.get("params", {}).get("include")
+            if include:
+                response = self.sideload_relationships(response, include.split(","))
+            return self.mock_response(response)
 
         if (
             len(query) == 7
@@ -348,6 +394,11 @@ class MockSuiteCRMServer:
             self.patch_entry(entry_id, entry_type, entry_attributes)
             return self.mock_response()
 
+        if endpoint == "/Api/V8/module/bulk":
+            for record in kwargs["json"]["data"]:
+                self.patch_entry(record["id"], record["type"], record["attributes"])
+            return self.mock_response()
+
         raise MethodException(f"Unhandled endpoint '{endpoint}'")
 
     def create_relationship_by_name(
@@ -389,6 +440,7 @@ class MockSuiteCRMServer:
         print(f"Simulating POST for {endpoint}")
 
         if endpoint == "/Api/access_token":
+            self.auth_requests += 1
             token_expiry = (datetime.now() + timedelta(hours=1)).timestamp()
             access_token = jwt.encode(
                 payload={
@@ -447,6 +499,11 @@ class MockSuiteCRMServer:
             self.create_record(new_user)
             return self.mock_response()
 
+        if endpoint == "/Api/V8/module/bulk":
+            for record in kwargs["json"]["data"]:
+                self.create_record({"data": record})
+            return self.mock_response()
+
         raise MethodException(f"Unhandled endpoint {endpoint}")
 
     def delete_relationship(
@@ -2,6 +2,7 @@
 
 import pytest
 
+from lifecycle import ConfigException
 from lifecycle.config_reader import ConfigReader
 
 
@@ -20,10 +21,21 @@ def test_config_file():
 
 def test_config_broken():
     """Test a single broken config file"""
-    with pytest.raises(SystemExit) as pytest_wrapped_e:
+    with pytest.raises(ConfigException) as pytest_wrapped_e:
         ConfigReader("tests/config/broken.yml")
-    assert pytest_wrapped_e.type == SystemExit
-    assert pytest_wrapped_e.value.code == 1
+    assert "broken.yml" in str(pytest_wrapped_e.value)
+
+
+def test_config_cache(monkeypatch, tmp_path):
+    """Test that a cached config is written and read back on a second load"""
+    monkeypatch.setenv("LIFECYCLE_CONFIG_CACHE", "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    config = ConfigReader("tests/config/working", raw=True)
+    cache_files = list((tmp_path / "lifecycle").iterdir())
+    assert len(cache_files) == 1
+
+    cached_config = ConfigReader("tests/config/working", raw=True)
+    assert cached_config.config_raw == config.config_raw
 
 
 def test_config_environment_variable(monkeypatch):
@@ -35,7 +47,6 @@ def test_config_environment_variable(monkeypatch):
 
 def test_config_environment_variable_not_provided():
     """Test replacing an nonexistant environment variable in a config file"""
-    with pytest.raises(SystemExit) as pytest_wrapped_e:
+    with pytest.raises(ConfigException) as pytest_wrapped_e:
         ConfigReader("tests/config/working/1.yml")
-    assert pytest_wrapped_e.type == SystemExit
-    assert pytest_wrapped_e.value.code == 1
+    assert "TEST_VARIABLE" in str(pytest_wrapped_e.value)
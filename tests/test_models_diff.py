@@ -178,6 +178,28 @@ def test_diff_unmatched_group_removed():
     assert diff.changed_users["test1"].groups == (Group("project1"),)
 
 
+def test_group_pattern_inline_flags():
+    """Tests that patterns with global inline flags, e.g. ``(?i)``, work"""
+    source_data = {
+        "test1": User("test1", groups=(Group("Admins"), Group("division1"))),
+    }
+    target_data = {
+        "test1": User("test1"),
+    }
+    config = {
+        "fields": [
+            "username",
+            "groups",
+        ],
+        "groups_patterns": [r"(?i)admins"],
+    }
+
+    diff = ModelDifference.calculate(
+        source_data, target_data, ModelDifferenceConfig.from_dict(config)
+    )
+    assert diff.changed_users["test1"].groups == (Group("Admins"),)
+
+
 def test_groups_ignore_ordering():
     """Tests that having groups in a different order doesn't count as a changed user"""
     source_data = {
@@ -3,7 +3,7 @@
 This checks the logic of config settings and mocks an LDAP server connection.
 """
 
-from unittest.mock import MagicMock, PropertyMock
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -71,15 +71,10 @@ def fixture_ldap_connection(mocker):
     """Fixture to create a test LDAP connection"""
 
     def _ldap_connection(user_data):
-        mock_entries = []
-        for entry in user_data:
-            mock_entry = MagicMock()
-            type(mock_entry).entry_attributes_as_dict = entry
-            mock_entries.append(mock_entry)
-
         mock_connection = MagicMock()
-        property_entries = PropertyMock(return_value=mock_entries)
-        type(mock_connection).entries = property_entries
+        mock_connection.extend.standard.paged_search.return_value = [
+            {"type": "searchResEntry", "attributes": entry} for entry in user_data
+        ]
 
         mocker.patch(
             "lifecycle.source_ldap3.SourceLDAP3.connect", return_value=mock_connection
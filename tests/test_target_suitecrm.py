@@ -2,6 +2,8 @@
 
 This checks the logic of config settings and mocks an SuiteCRM server connection.
 """
+import threading
+
 import pytest
 
 from lifecycle.model_diff import ModelDifference
@@ -95,6 +97,36 @@ def test_create_multi_email(basic_target, suitecrm_server):
         assert email_entry["attributes"]["email_address"] in emails
 
 
+def test_create_multi_email_bulk(basic_config, suitecrm_server):
+    """Create a user's E-mail addresses through the bulk endpoint"""
+    emails = ("foo.bar@example.org", "foo.bar@example.com")
+    user = User(
+        "foobar",
+        forename="Foo",
+        surname="Bar",
+        fullname="Foo Bar",
+        email=emails,
+    )
+    server = suitecrm_server([])
+    config = basic_config.copy()
+    config["api_bulk_operations"] = True
+    target = TargetSuiteCRM(config, None)
+
+    diff = ModelDifference(
+        source_users={"foobar": user},
+        target_users={},
+        added_users={"foobar": user},
+        removed_users={},
+        unchanged_users={},
+        changed_users={},
+    )
+    target.users_create(diff)
+    found_emails = server.search_by_type("EmailAddress")
+    assert len(found_emails) == 2
+    for email_entry in found_emails:
+        assert email_entry["attributes"]["email_address"] in emails
+
+
 @pytest.mark.parametrize(
     "after_emails",
     [
@@ -153,6 +185,26 @@ def test_basic_fetch(basic_target, suitecrm_server):
     assert users == expected_users
 
 
+def test_fetch_users_paginated(basic_config, suitecrm_server):
+    """Fetch users spread over several pages of results"""
+    server = suitecrm_server([])
+    usernames = {f"user{index}" for index in range(5)}
+    for username in sorted(usernames):
+        server.create_user(
+            {
+                "user_name": username,
+                "first_name": "Test",
+                "last_name": "User",
+                "status": "Active",
+            }
+        )
+    config = basic_config.copy()
+    config["api_page_size"] = 2
+    target = TargetSuiteCRM(config, None)
+    users = target.fetch_users()
+    assert set(users.keys()) == usernames
+
+
 def test_groups_fetch(basic_target, suitecrm_server):
     """Check security groups on the server are fetched to the user"""
     server = suitecrm_server()
@@ -307,24 +359,32 @@ def test_users_admin_group(create_admin_group_source, basic_config, suitecrm_ser
     diff = target.calculate_difference()
     target.users_create(diff)
 
-    users = server.search_by_type("User")
-    assert users[0]["attributes"]["is_admin"] == "1"
-    assert users[1]["attributes"]["is_admin"] == "0"
+    # Users are created concurrently, so look them up by name rather
+    # than relying on creation order
+    foobar = server.get_entry_by_attribute("user_name", "foobar")
+    bazquux = server.get_entry_by_attribute("user_name", "bazquux")
+    assert foobar["attributes"]["is_admin"] == "1"
+    assert bazquux["attributes"]["is_admin"] == "0"
 
     target = TargetSuiteCRM(config, create_admin_group_source(False))
 
     diff = target.calculate_difference()
     target.users_sync(diff)
 
-    users = server.search_by_type("User")
-    assert users[0]["attributes"]["is_admin"] == "0"
-    assert users[1]["attributes"]["is_admin"] == "0"
+    foobar = server.get_entry_by_attribute("user_name", "foobar")
+    bazquux = server.get_entry_by_attribute("user_name", "bazquux")
+    assert foobar["attributes"]["is_admin"] == "0"
+    assert bazquux["attributes"]["is_admin"] == "0"
 
 
-def test_users_update(basic_target, suitecrm_server):
+@pytest.mark.parametrize("bulk", [False, True])
+def test_users_update(bulk, basic_config, suitecrm_server):
     """Update the attributes of an existing user and check the changes have
-    been made
+    been made, through both the per-record and bulk endpoints
     """
+    config = basic_config.copy()
+    config["api_bulk_operations"] = bulk
+    target = TargetSuiteCRM(config, None)
     server = suitecrm_server([])
     server.create_user(
         {
@@ -340,7 +400,7 @@ def test_users_update(basic_target, suitecrm_server):
         source_users={
             "basicuser": User(
                 "basicuser",
-                forename="Basic",
+                forename="Deluxe",
                 surname="Bob",
                 email=("basic.bob@example.org",),
             ),
@@ -348,7 +408,7 @@ def test_users_update(basic_target, suitecrm_server):
         target_users={
             "basicuser": User(
                 "basicuser",
-                forename="Deluxe",
+                forename="Basic",
                 surname="Bob",
                 email=("basic.bob@example.org",),
             ),
@@ -365,7 +425,7 @@ def test_users_update(basic_target, suitecrm_server):
             )
         },
     )
-    basic_target.users_sync(diff)
+    target.users_sync(diff)
     users = server.search_by_type("User")
     assert users[0]["attributes"]["first_name"] == "Deluxe"
 
@@ -664,12 +724,34 @@ def test_group_add_update_not_recreate(basic_config, suitecrm_server):
     ), "The old group wasn't updated"
 
 
+def test_token_cache(basic_config, suitecrm_server, tmp_path):
+    """A token cached to disk is reused by a later target instance"""
+    server = suitecrm_server()
+    cache_path = tmp_path / "token.json"
+    config = basic_config.copy()
+    config["token_cache_path"] = str(cache_path)
+
+    target = TargetSuiteCRM(config, None)
+    target.fetch_users()
+    assert cache_path.exists()
+    assert server.auth_requests == 1
+
+    fresh_target = TargetSuiteCRM(config, None)
+    fresh_target.fetch_users()
+    # The fresh target loaded the cached token, so it never had to
+    # request one of its own
+    assert server.auth_requests == 1
+
+
 @pytest.fixture(name="suitecrm_server")
 def fixture_suitecrm_server(mocker):
-    """Patches requests.request so that it gets routed through a MockSuiteCRMServer"""
+    """Patches requests.Session.request so that it gets routed through a MockSuiteCRMServer"""
 
     def _request_server(server_data: dict = None):
         server = MockSuiteCRMServer(server_data)
+        # The target issues requests from worker threads; the mock server
+        # is plain Python data, so serialise access to it
+        server_lock = threading.Lock()
 
         def _suitecrm_request(method, url, **kwargs):
             """We have to stimulate requests.request.
@@ -686,18 +768,19 @@ def fixture_suitecrm_server(mocker):
             #        "Unexpected redirect. (Redirecting is true by default)"
             #    )
 
-            if method == "GET":
-                return server.mock_get(endpoint, **kwargs)
-            if method == "PATCH":
-                return server.mock_patch(endpoint, **kwargs)
-            if method == "POST":
-                return server.mock_post(endpoint, **kwargs)
-            if method == "DELETE":
-                return server.mock_delete(endpoint, **kwargs)
+            with server_lock:
+                if method == "GET":
+                    return server.mock_get(endpoint, **kwargs)
+                if method == "PATCH":
+                    return server.mock_patch(endpoint, **kwargs)
+                if method == "POST":
+                    return server.mock_post(endpoint, **kwargs)
+                if method == "DELETE":
+                    return server.mock_delete(endpoint, **kwargs)
 
             raise MethodException(f"Invalid method used '{method}'")
 
-        mocker.patch("requests.request", side_effect=_suitecrm_request)
+        mocker.patch("requests.Session.request", side_effect=_suitecrm_request)
         return server
 
     return _request_server